@@ -61,25 +61,30 @@ class CategoricalSimilarityEmbedding(Embedding[list[str]], HasLength, HasDefault
             if self.categorical_similarity_param.uncategorized_as_category
             else None
         )
+        self.__normalized_vector_input: float = self.__get_normalized_vector_input()
 
     @override
     def embed(self, input_: list[str] | str, context: ExecutionContext) -> Vector:
         inputs: list[str] = input_ if isinstance(input_, list) else [input_]
-        one_hot_encoding: NPArray = self.__n_hot_encode(
-            inputs, context.is_query_context
-        )
-        return Vector(one_hot_encoding)
+        return Vector(self.embed_batch([inputs], context.is_query_context)[0])
 
-    def __n_hot_encode(self, category_list: list[str], is_query: bool) -> NPArray:
-        n_hot_encoding: NPArray = np.full(
-            self.__length,
+    def embed_batch(self, inputs: Sequence[list[str]], is_query: bool) -> NPArray:
+        n_hot_encodings: NPArray = np.full(
+            (len(inputs), self.__length),
             0 if is_query else self.categorical_similarity_param.negative_filter,
             dtype=np.float64,
         )
-        category_indices: Sequence[int] = self.__get_category_indices(category_list)
+        row_indices: list[int] = []
+        category_indices: list[int] = []
+        for row_index, category_list in enumerate(inputs):
+            row_category_indices = self.__get_category_indices(category_list)
+            row_indices.extend([row_index] * len(row_category_indices))
+            category_indices.extend(row_category_indices)
         if category_indices:
-            n_hot_encoding[category_indices] = self.__get_normalized_vector_input()
-        return n_hot_encoding
+            n_hot_encodings[row_indices, category_indices] = (
+                self.__normalized_vector_input
+            )
+        return n_hot_encodings
 
     def __get_normalized_vector_input(self) -> float:
         vector_input = np.array([CATEGORICAL_ENCODING_VALUE])
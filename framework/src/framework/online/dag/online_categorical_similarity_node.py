@@ -30,6 +30,8 @@ from superlinked.framework.online.dag.evaluation_result import EvaluationResult
 from superlinked.framework.online.dag.online_node import OnlineNode
 from superlinked.framework.online.dag.parent_validator import ParentValidationType
 
+CATEGORY_EMBEDDING_CACHE_SIZE = 1024
+
 
 class OnlineCategoricalSimilarityNode(
     OnlineNode[CategoricalSimilarityNode, Vector], HasLength
@@ -46,6 +48,12 @@ class OnlineCategoricalSimilarityNode(
             storage_manager,
             ParentValidationType.LESS_THAN_TWO_PARENTS,
         )
+        self.__default_result: EvaluationResult[Vector] = EvaluationResult(
+            self._get_single_evaluation_result(self.node.embedding.default_vector)
+        )
+        self.__result_cache: dict[
+            tuple[frozenset[str], bool], EvaluationResult[Vector]
+        ] = {}
 
     @property
     def length(self) -> int:
@@ -57,7 +65,19 @@ class OnlineCategoricalSimilarityNode(
         parsed_schemas: list[ParsedSchema],
         context: ExecutionContext,
     ) -> list[EvaluationResult[Vector]]:
-        return [self.evaluate_self_single(schema, context) for schema in parsed_schemas]
+        if context.should_load_default_node_input:
+            return [self.__default_result for _ in parsed_schemas]
+        if len(self.parents) == 0:
+            return [
+                self.evaluate_self_single(schema, context) for schema in parsed_schemas
+            ]
+        inputs: list[EvaluationResult[list[str]]] = cast(
+            OnlineNode[Node[list[str]], list[str]],
+            self.parents[0],
+        ).evaluate_next(parsed_schemas, context)
+        return self.__evaluate_inputs(
+            [input_.main.value for input_ in inputs], context.is_query_context
+        )
 
     def evaluate_self_single(
         self,
@@ -65,13 +85,45 @@ class OnlineCategoricalSimilarityNode(
         context: ExecutionContext,
     ) -> EvaluationResult[Vector]:
         if context.should_load_default_node_input:
-            result = self.node.embedding.default_vector
-        elif len(self.parents) == 0:
+            return self.__default_result
+        if len(self.parents) == 0:
             result = self.load_stored_result_or_raise_exception(parsed_schema)
-        else:
-            input_: EvaluationResult[list[str]] = cast(
-                OnlineNode[Node[list[str]], list[str]],
-                self.parents[0],
-            ).evaluate_next_single(parsed_schema, context)
-            result = self.node.embedding.embed(input_.main.value, context)
-        return EvaluationResult(self._get_single_evaluation_result(result))
+            return EvaluationResult(self._get_single_evaluation_result(result))
+        input_: EvaluationResult[list[str]] = cast(
+            OnlineNode[Node[list[str]], list[str]],
+            self.parents[0],
+        ).evaluate_next_single(parsed_schema, context)
+        (evaluation_result,) = self.__evaluate_inputs(
+            [input_.main.value], context.is_query_context
+        )
+        return evaluation_result
+
+    def __evaluate_inputs(
+        self, inputs: list[list[str] | str], is_query: bool
+    ) -> list[EvaluationResult[Vector]]:
+        keys = [
+            (frozenset(input_ if isinstance(input_, list) else [input_]), is_query)
+            for input_ in inputs
+        ]
+        missing_keys = list(
+            dict.fromkeys(key for key in keys if key not in self.__result_cache)
+        )
+        if missing_keys:
+            if (
+                len(self.__result_cache) + len(missing_keys)
+                > CATEGORY_EMBEDDING_CACHE_SIZE
+            ):
+                self.__result_cache.clear()
+            embeddings = self.node.embedding.embed_batch(
+                [list(categories) for categories, _ in missing_keys], is_query
+            )
+            self.__result_cache.update(
+                (
+                    key,
+                    EvaluationResult(
+                        self._get_single_evaluation_result(Vector(embedding))
+                    ),
+                )
+                for key, embedding in zip(missing_keys, embeddings)
+            )
+        return [self.__result_cache[key] for key in keys]
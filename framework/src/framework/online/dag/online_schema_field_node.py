@@ -58,14 +58,17 @@ class OnlineSchemaFieldNode(Generic[SFT], OnlineNode[SchemaFieldNode, SFT]):
         parsed_schema: ParsedSchema,
         context: ExecutionContext,
     ) -> EvaluationResult[SFT]:
-        parsed_nodes: list[ParsedSchemaField] = [
-            field
-            for field in parsed_schema.fields
-            if field.schema_field == self.node.schema_field
-        ]
+        parsed_node: ParsedSchemaField | None = next(
+            (
+                field
+                for field in parsed_schema.fields
+                if field.schema_field == self.node.schema_field
+            ),
+            None,
+        )
         result: SFT
-        if parsed_nodes:
-            result = parsed_nodes[0].value
+        if parsed_node is not None:
+            result = parsed_node.value
         else:
             result = self.__get_default_result(parsed_schema, context)
         return EvaluationResult(self._get_single_evaluation_result(result))
@@ -0,0 +1,49 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+
+from superlinked.framework.common.embedding.categorical_similarity_embedding import (
+    CategoricalSimilarityEmbedding,
+    CategoricalSimilarityParams,
+)
+from superlinked.framework.common.space.normalization import L2Norm
+
+
+@pytest.mark.parametrize("uncategorized_as_category", [True, False])
+@pytest.mark.parametrize("is_query", [True, False])
+def test_embed_batch(uncategorized_as_category: bool, is_query: bool) -> None:
+    embedding = CategoricalSimilarityEmbedding(
+        CategoricalSimilarityParams(
+            categories=["a", "b", "c"],
+            uncategorized_as_category=uncategorized_as_category,
+            negative_filter=-1.0,
+        ),
+        L2Norm(),
+    )
+    missing = 0.0 if is_query else -1.0
+    other = 1.0 if uncategorized_as_category else missing
+
+    result = embedding.embed_batch([["a"], ["c", "b", "c"], ["x"], []], is_query)
+
+    np.testing.assert_array_equal(
+        result,
+        [
+            [1.0, missing, missing, missing],
+            [missing, 1.0, 1.0, missing],
+            [missing, missing, missing, other],
+            [missing, missing, missing, missing],
+        ],
+    )
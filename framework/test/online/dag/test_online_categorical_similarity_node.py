@@ -0,0 +1,164 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from beartype.typing import Any
+from typing_extensions import override
+
+from superlinked.framework.common.dag.categorical_similarity_node import (
+    CategoricalSimilarityNode,
+)
+from superlinked.framework.common.dag.context import (
+    ExecutionContext,
+    ExecutionEnvironment,
+)
+from superlinked.framework.common.dag.node import Node
+from superlinked.framework.common.embedding.categorical_similarity_embedding import (
+    CategoricalSimilarityEmbedding,
+    CategoricalSimilarityParams,
+)
+from superlinked.framework.common.parser.parsed_schema import ParsedSchema
+from superlinked.framework.online.dag.evaluation_result import EvaluationResult
+from superlinked.framework.online.dag.online_categorical_similarity_node import (
+    OnlineCategoricalSimilarityNode,
+)
+from superlinked.framework.online.dag.online_node import OnlineNode
+
+INPUTS: dict[str, list[str]] = {
+    "1": ["a"],
+    "2": ["b", "a"],
+    "3": ["a"],
+    "4": ["unknown"],
+    "5": ["a", "b"],
+}
+
+
+class CategoryInputNode(Node[list[str]]):
+    def __init__(self) -> None:
+        super().__init__(list, [])
+
+    @override
+    def _get_node_id_parameters(self) -> dict[str, Any]:
+        return {}
+
+
+class OnlineCategoryInputNode(OnlineNode[CategoryInputNode, list[str]]):
+    def __init__(self, node: CategoryInputNode) -> None:
+        super().__init__(node, [], MagicMock())
+
+    @override
+    def evaluate_self(
+        self,
+        parsed_schemas: list[ParsedSchema],
+        context: ExecutionContext,
+    ) -> list[EvaluationResult[list[str]]]:
+        return [
+            EvaluationResult(self._get_single_evaluation_result(INPUTS[schema.id_]))
+            for schema in parsed_schemas
+        ]
+
+
+@pytest.fixture
+def online_node() -> OnlineCategoricalSimilarityNode:
+    input_node = CategoryInputNode()
+    node = CategoricalSimilarityNode(
+        input_node,
+        CategoricalSimilarityParams(
+            categories=["a", "b", "c"],
+            uncategorized_as_category=True,
+            negative_filter=-1.0,
+        ),
+    )
+    return OnlineCategoricalSimilarityNode(
+        node, [OnlineCategoryInputNode(input_node)], MagicMock()
+    )
+
+
+def parsed_schemas() -> list[ParsedSchema]:
+    return [ParsedSchema(MagicMock(), id_, []) for id_ in INPUTS]
+
+
+@pytest.mark.parametrize(
+    "environment", [ExecutionEnvironment.IN_MEMORY, ExecutionEnvironment.QUERY]
+)
+def test_evaluate_self_matches_embedding(
+    online_node: OnlineCategoricalSimilarityNode, environment: ExecutionEnvironment
+) -> None:
+    context = ExecutionContext(environment)
+
+    results = online_node.evaluate_self(parsed_schemas(), context)
+
+    assert [result.main.value for result in results] == [
+        online_node.node.embedding.embed(value, context) for value in INPUTS.values()
+    ]
+
+
+def test_evaluate_self_embeds_each_category_set_once(
+    online_node: OnlineCategoricalSimilarityNode,
+) -> None:
+    context = ExecutionContext(ExecutionEnvironment.IN_MEMORY)
+    with patch.object(
+        CategoricalSimilarityEmbedding,
+        "embed_batch",
+        autospec=True,
+        side_effect=CategoricalSimilarityEmbedding.embed_batch,
+    ) as embed_batch:
+        online_node.evaluate_self(parsed_schemas(), context)
+        online_node.evaluate_self(parsed_schemas(), context)
+
+    embed_batch.assert_called_once()
+    assert len(embed_batch.call_args.args[1]) == 3
+
+
+def test_evaluate_self_caches_query_and_ingestion_separately(
+    online_node: OnlineCategoricalSimilarityNode,
+) -> None:
+    ingestion_results = online_node.evaluate_self(
+        parsed_schemas(), ExecutionContext(ExecutionEnvironment.IN_MEMORY)
+    )
+    query_results = online_node.evaluate_self(
+        parsed_schemas(), ExecutionContext(ExecutionEnvironment.QUERY)
+    )
+
+    assert ingestion_results[0].main.value != query_results[0].main.value
+
+
+def test_evaluate_self_returns_default_vector(
+    online_node: OnlineCategoricalSimilarityNode,
+) -> None:
+    context = ExecutionContext(ExecutionEnvironment.QUERY)
+    context.set_load_default_node_input(True)
+
+    results = online_node.evaluate_self(parsed_schemas(), context)
+
+    assert len(results) == len(INPUTS)
+    assert all(
+        result.main.value == online_node.node.embedding.default_vector
+        for result in results
+    )
+
+
+def test_evaluate_self_reuses_results_of_equal_category_sets(
+    online_node: OnlineCategoricalSimilarityNode,
+) -> None:
+    context = ExecutionContext(ExecutionEnvironment.IN_MEMORY)
+
+    first = online_node.evaluate_self(parsed_schemas(), context)
+    second = online_node.evaluate_self(parsed_schemas(), context)
+
+    assert first[0] is first[2]
+    assert first[1] is first[4]
+    assert all(a is b for a, b in zip(first, second))
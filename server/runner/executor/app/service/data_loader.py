@@ -13,14 +13,26 @@
 # limitations under the License.
 
 import asyncio
+import itertools
 import logging
 import traceback
-from collections.abc import Sequence
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+import fsspec
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
+import pyarrow as pa
 from pandas.io.json._json import JsonReader
 from pandas.io.parsers import TextFileReader
+from pyarrow import csv as pa_csv
+from pyarrow import dataset as pa_dataset
+from pyarrow import fs as pa_fs
+from pyarrow import json as pa_json
+from pyarrow import orc as pa_orc
+from pyarrow import parquet as pa_parquet
 from pydantic.alias_generators import to_snake
 from superlinked.framework.dsl.source.data_loader_source import DataFormat, DataLoaderConfig, DataLoaderSource
 
@@ -30,24 +42,84 @@ from executor.app.exception.exception import (
     DataLoaderNotFoundException,
     DataLoaderTaskNotFoundException,
 )
+from executor.app.util.csv_chunk_splitter import CsvChunkSplitter
 
 logger = logging.getLogger(__name__)
 
+ARROW_CSV_BLOCK_SIZE = 8 << 20
+ARROW_CSV_SUPPORTED_KWARGS = frozenset(
+    {"sep", "delimiter", "dtype", "na_values", "usecols", "chunksize", "dtype_backend"}
+)
+ARROW_PARQUET_SUPPORTED_KWARGS = frozenset({"columns", "chunksize", "dtype_backend"})
+ARROW_ORC_SUPPORTED_KWARGS = frozenset({"columns", "dtype_backend"})
+ARROW_JSON_BLOCK_SIZE = 8 << 20
+ARROW_JSON_SUPPORTED_KWARGS = frozenset({"lines", "engine", "chunksize", "dtype_backend"})
+ARROW_JSON_ENGINE = "pyarrow"
+ARROW_DTYPE_BACKEND = "pyarrow"
+ARROW_DTYPE_BACKEND_FORMATS = frozenset({DataFormat.CSV, DataFormat.JSON, DataFormat.PARQUET, DataFormat.ORC})
+ARROW_STRING_DTYPES = frozenset({"str", "string", "object"})
+PANDAS_CSV_SPLITTABLE_KWARGS = frozenset(
+    {
+        "sep",
+        "delimiter",
+        "dtype",
+        "na_values",
+        "keep_default_na",
+        "na_filter",
+        "usecols",
+        "true_values",
+        "false_values",
+        "decimal",
+        "thousands",
+        "parse_dates",
+        "date_format",
+        "dtype_backend",
+    }
+)
+CSV_SPLIT_MIN_CHUNK_SIZE = 16 << 20
+HTTP_SCHEMES = ("http://", "https://")
+REMOTE_PARQUET_FORMAT = pa_dataset.ParquetFileFormat(
+    default_fragment_scan_options=pa_dataset.ParquetFragmentScanOptions(
+        pre_buffer=True,
+        cache_options=pa.CacheOptions.from_network_metrics(
+            time_to_first_byte_millis=100, transfer_bandwidth_mib_per_sec=100
+        ),
+    )
+)
+PREFETCH_DEPTH = 2
+
+ReadData = pa.Table | pd.DataFrame | TextFileReader | JsonReader | Iterator[pd.DataFrame]
+CsvCacheKey = tuple[str, str, tuple[str, ...], tuple[str, ...]]
+
 
 class DataLoader:
     def __init__(self, app_config: AppConfig) -> None:
         self._app_config = app_config
         self._data_loader_sources: dict[str, DataLoaderSource] = {}
         self._data_loader_tasks: dict[str, asyncio.Task] = {}
+        self._executor = ThreadPoolExecutor(
+            max_workers=app_config.DATA_LOADER_THREAD_COUNT, thread_name_prefix="data-loader-reader"
+        )
+        self._scheduler = ThreadPoolExecutor(max_workers=1, thread_name_prefix="data-loader-scheduler")
+        self.__csv_column_types: dict[CsvCacheKey, tuple[tuple[int, int], dict[str, pa.DataType]]] = {}
+        self.__readers: dict[DataFormat, Callable[[str, dict[str, Any]], ReadData]] = {
+            DataFormat.CSV: self.__read_csv,
+            DataFormat.FWF: lambda path, kwargs: pd.read_fwf(path, **kwargs),
+            DataFormat.XML: lambda path, kwargs: pd.read_xml(path, **kwargs),
+            DataFormat.JSON: self.__read_json,
+            DataFormat.PARQUET: self.__read_parquet,
+            DataFormat.ORC: self.__read_orc,
+        }
 
     def register_data_loader_sources(self, data_loader_sources: Sequence[DataLoaderSource]) -> None:
         for source in data_loader_sources:
-            if source.name in self._data_loader_sources:
+            name = to_snake(source.name)
+            if name in self._data_loader_sources:
                 logger.warning(
-                    "Data loader source with the name '%s' is already registered. Skipping registration.", source.name
+                    "Data loader source with the name '%s' is already registered. Skipping registration.", name
                 )
                 continue
-            self._data_loader_sources[to_snake(source.name)] = source
+            self._data_loader_sources[name] = source
 
     def get_data_loaders(self) -> dict[str, DataLoaderConfig]:
         return {name: source.config for name, source in self._data_loader_sources.items()}
@@ -62,8 +134,8 @@ class DataLoader:
             msg = f"Data loader already running with name: {name}"
             raise DataLoaderAlreadyRunningException(msg)
         logger.info("Starting data load for source with the following configuration: %s", data_loader_source.config)
-        task = asyncio.create_task(asyncio.to_thread(self.__read_and_put_data, data_loader_source))
-        self._data_loader_tasks.update({name: task})
+        task = asyncio.create_task(self.__read_and_put_data(data_loader_source))
+        self._data_loader_tasks[name] = task
 
     def get_task_status_by_name(self, name: str) -> str | None:
         task = self._data_loader_tasks.get(name)
@@ -81,48 +153,436 @@ class DataLoader:
 
         return "Task completed successfully"
 
-    def __read_and_put_data(self, source: DataLoaderSource) -> None:
-        data = self.__read_data(source.config.path, source.config.format, source.config.pandas_read_kwargs)
+    async def __read_and_put_data(self, source: DataLoaderSource) -> None:
+        loop = asyncio.get_running_loop()
+        data = await loop.run_in_executor(self._executor, self.__read_frames, source.config)
         if isinstance(data, pd.DataFrame):
-            if logger.isEnabledFor(logging.DEBUG):
-                data.info(memory_usage=True)
+            await loop.run_in_executor(self._scheduler, self.__put_frame, source, data, "Data frame")
+        else:
+            await self.__put_chunks(source, data)
+        logger.info("Finished the data load for source with the following configuration: %s", source.config)
+
+    def __read_frames(self, config: DataLoaderConfig) -> pd.DataFrame | Iterator[pd.DataFrame]:
+        data = self.__read_data(config.path, config.format, config.pandas_read_kwargs)
+        if isinstance(data, pa.Table | pd.DataFrame):
+            return _to_put_frame(data)
+        if isinstance(data, TextFileReader | JsonReader | Iterator):
+            return map(_to_put_frame, iter(data))
+        error_message = (
+            f"The returned object from the Pandas read method was not of the expected type. Actual type: {type(data)}"
+        )
+        raise TypeError(error_message)
+
+    async def __put_chunks(self, source: DataLoaderSource, chunks: Iterator[pd.DataFrame]) -> None:
+        """
+        Read the next chunks on the reader pool while the current one is persisted, queueing at most
+        `PREFETCH_DEPTH` of them. Together with the chunk waiting to be queued and the one being persisted,
+        up to `PREFETCH_DEPTH + 2` chunks are held in memory at once. Each chunk is handed to the scheduler
+        on its own, so the scheduler only persists and the chunks of concurrent sources take turns on it.
+        """
+        loop = asyncio.get_running_loop()
+        buffer: asyncio.Queue[pd.DataFrame | None] = asyncio.Queue(maxsize=PREFETCH_DEPTH)
+
+        async def produce() -> None:
+            try:
+                while (chunk := await loop.run_in_executor(self._executor, next, chunks, None)) is not None:
+                    await buffer.put(chunk)
+            except Exception:
+                await buffer.put(None)
+                raise
+            await buffer.put(None)
+
+        producer = asyncio.create_task(produce())
+        try:
+            while (chunk := await buffer.get()) is not None:
+                await loop.run_in_executor(self._scheduler, self.__put_frame, source, chunk, "Chunk")
+        finally:
+            producer.cancel()
+        await producer
+
+    def __put_frame(self, source: DataLoaderSource, data_frame: pd.DataFrame, description: str) -> None:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug(
-                "Data frame of size: %s has been loaded into memory. Beginning persistence process.", len(data)
+                "%s of shape: %s and %i bytes has been loaded into memory. Beginning persistence process.",
+                description,
+                data_frame.shape,
+                data_frame.memory_usage(index=False).sum(),
             )
-            source._source.put(data)  # noqa: SLF001 private-member-access
-        elif isinstance(data, TextFileReader | JsonReader):
-            for chunk in data:
-                if logger.isEnabledFor(logging.DEBUG):
-                    chunk.info(memory_usage=True)
-                logger.debug(
-                    "Chunk of size: %s has been loaded into memory. Beginning persistence process.", len(chunk)
+        source._source.put(data_frame)  # noqa: SLF001 private-member-access
+
+    def __read_data(self, path: str, data_format: DataFormat, pandas_read_kwargs: dict[str, Any] | None) -> ReadData:
+        kwargs = dict(pandas_read_kwargs or {})
+        if data_format in ARROW_DTYPE_BACKEND_FORMATS:
+            kwargs.setdefault("dtype_backend", ARROW_DTYPE_BACKEND)
+        if "dtype_backend" in kwargs and kwargs["dtype_backend"] is None:
+            del kwargs["dtype_backend"]
+        if (reader := self.__readers.get(data_format)) is None:
+            msg = "Unsupported data format: %s"
+            raise ValueError(msg, data_format)
+        return reader(path, kwargs)
+
+    def __read_csv(self, path: str, kwargs: dict[str, Any]) -> pd.DataFrame | TextFileReader | Iterator[pd.DataFrame]:
+        options = _to_arrow_csv_options(kwargs)
+        filesystem_and_path = _resolve_filesystem(path)
+        if options is None or filesystem_and_path is None:
+            logger.debug("Falling back to the pandas CSV reader, the source is not readable with Arrow: %s", path)
+            return self.__read_csv_with_pandas(path, kwargs)
+        filesystem, file_path = filesystem_and_path
+        parse_options, convert_options = options
+        read_options = pa_csv.ReadOptions(block_size=ARROW_CSV_BLOCK_SIZE, use_threads=True)
+        cache_key = _get_csv_cache_key(path, parse_options, convert_options)
+        try:
+            inferred_types = self.__get_inferred_csv_column_types(
+                cache_key, filesystem_and_path, read_options, parse_options, convert_options
+            )
+            convert_options.column_types = inferred_types | dict(convert_options.column_types)
+            if kwargs.get("chunksize"):
+                return self.__iter_arrow_csv(
+                    path, kwargs, filesystem_and_path, (read_options, parse_options, convert_options)
                 )
-                source._source.put(chunk)  # noqa: SLF001 private-member-access
-        else:
-            error_message = (
-                "The returned object from the Pandas read method was not of the "
-                f"expected type. Actual type: {type(data)}"
+            with filesystem.open_input_stream(file_path) as stream:
+                table = pa_csv.read_csv(
+                    stream, read_options=read_options, parse_options=parse_options, convert_options=convert_options
+                )
+        except pa.ArrowInvalid:
+            logger.warning("Arrow could not parse the CSV, falling back to the pandas CSV reader: %s", path)
+            self.__csv_column_types.pop(cache_key, None)
+            return self.__read_csv_with_pandas(path, kwargs)
+        return _arrow_to_pandas(table)
+
+    def __get_inferred_csv_column_types(
+        self,
+        cache_key: CsvCacheKey,
+        filesystem_and_path: tuple[pa_fs.FileSystem, str],
+        read_options: pa_csv.ReadOptions,
+        parse_options: pa_csv.ParseOptions,
+        convert_options: pa_csv.ConvertOptions,
+    ) -> dict[str, pa.DataType]:
+        """
+        Column types Arrow infers from the first block of the CSV, without the types set by the user.
+        They are cached until the modification time or the size of the file changes.
+        Files without a known modification time are inferred on every read.
+        """
+        filesystem, file_path = filesystem_and_path
+        file_info = filesystem.get_file_info(file_path)
+        file_version = None if file_info.mtime_ns is None else (file_info.mtime_ns, file_info.size)
+        cached_version, inferred_types = self.__csv_column_types.get(cache_key, (None, None))
+        if inferred_types is not None and file_version is not None and cached_version == file_version:
+            return inferred_types
+        inference_options = pa_csv.ConvertOptions(
+            null_values=convert_options.null_values,
+            strings_can_be_null=convert_options.strings_can_be_null,
+            include_columns=convert_options.include_columns,
+        )
+        with filesystem.open_input_stream(file_path) as stream:
+            schema = pa_csv.open_csv(
+                stream, read_options=read_options, parse_options=parse_options, convert_options=inference_options
+            ).schema
+        inferred_types = _get_inferred_csv_column_types(schema)
+        if file_version is not None:
+            self.__csv_column_types[cache_key] = (file_version, inferred_types)
+        return inferred_types
+
+    def __iter_arrow_csv(
+        self,
+        path: str,
+        kwargs: dict[str, Any],
+        filesystem_and_path: tuple[pa_fs.FileSystem, str],
+        options: tuple[pa_csv.ReadOptions, pa_csv.ParseOptions, pa_csv.ConvertOptions],
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Stream the CSV in chunks of `chunksize` rows. The column types are fixed before the first block,
+        so a later value that does not fit them raises ArrowInvalid; the rest of the file is then read
+        by pandas, skipping the chunks that were already yielded.
+        """
+        filesystem, file_path = filesystem_and_path
+        read_options, parse_options, convert_options = options
+        yielded_chunks = 0
+        try:
+            with filesystem.open_input_stream(file_path) as stream:
+                reader = pa_csv.open_csv(
+                    stream, read_options=read_options, parse_options=parse_options, convert_options=convert_options
+                )
+                for table in _rebatch(reader, kwargs["chunksize"]):
+                    yield _arrow_to_pandas(table)
+                    yielded_chunks += 1
+        except pa.ArrowInvalid:
+            logger.warning(
+                "Arrow could not parse the CSV after %i chunks, continuing with the pandas CSV reader: %s",
+                yielded_chunks,
+                path,
             )
-            raise TypeError(error_message)
-        logger.info("Finished the data load for source with the following configuration: %s", source.config)
+            self.__csv_column_types.pop(_get_csv_cache_key(path, parse_options, convert_options), None)
+            with pd.read_csv(path, **kwargs) as pandas_reader:
+                yield from itertools.islice(pandas_reader, yielded_chunks, None)
+
+    def __read_csv_with_pandas(self, path: str, kwargs: dict[str, Any]) -> pd.DataFrame | TextFileReader:
+        if _is_local_path(path) and _is_csv_splittable(kwargs):
+            return self.__read_csv_in_parallel(path.removeprefix("file://"), kwargs)
+        return pd.read_csv(path, **kwargs)
+
+    def __read_csv_in_parallel(self, path: str, kwargs: dict[str, Any]) -> pd.DataFrame:
+        with pa.memory_map(path) as mapped_file:
+            data = mapped_file.read_buffer()
+        chunk_count = min(self._app_config.DATA_LOADER_THREAD_COUNT, data.size // CSV_SPLIT_MIN_CHUNK_SIZE)
+        view = memoryview(data)
+        header_end = CsvChunkSplitter.find_header_end(view)
+        if chunk_count <= 1 or header_end is None:
+            return pd.read_csv(path, **kwargs)
+        column_names = _read_csv_column_names(data.slice(0, header_end), kwargs)
+        chunks = [
+            data.slice(start, end - start) for start, end in CsvChunkSplitter.split(view, header_end, chunk_count)
+        ]
+        with ThreadPoolExecutor(max_workers=len(chunks), thread_name_prefix="data-loader-csv") as pool:
+            frames = list(pool.map(lambda chunk: _read_csv_chunk(chunk, column_names, kwargs), chunks))
+        if mixed_columns := _get_mixed_type_columns(frames):
+            logger.debug(
+                "Inferred types of columns %s differ between CSV chunks, re-reading the file in one pass.",
+                mixed_columns,
+            )
+            return pd.read_csv(path, **kwargs)
+        return pd.concat(frames, ignore_index=True, copy=False)
+
+    def __read_parquet(self, path: str, kwargs: dict[str, Any]) -> pd.DataFrame | Iterator[pd.DataFrame]:
+        filesystem_and_path = _resolve_filesystem(path)
+        if filesystem_and_path is None or not _is_arrow_compatible(kwargs, ARROW_PARQUET_SUPPORTED_KWARGS):
+            pandas_kwargs = {key: value for key, value in kwargs.items() if key != "chunksize"}
+            data_frame = pd.read_parquet(path, **pandas_kwargs)
+            return _iter_frame_chunks(data_frame, kwargs["chunksize"]) if kwargs.get("chunksize") else data_frame
+        filesystem, file_path = filesystem_and_path
+        columns = kwargs.get("columns")
+        row_groups = (
+            _read_row_groups(pa_parquet.ParquetFile(file_path, filesystem=filesystem, pre_buffer=True), columns)
+            if _is_local_path(path)
+            else _read_remote_row_groups(file_path, filesystem, columns)
+        )
+        return _iter_arrow_tables(row_groups, kwargs.get("chunksize"))
+
+    def __read_json(
+        self, path: str, kwargs: dict[str, Any]
+    ) -> pa.Table | pd.DataFrame | JsonReader | Iterator[pd.DataFrame]:
+        filesystem_and_path = _resolve_filesystem(path)
+        if (
+            filesystem_and_path is None
+            or kwargs.get("engine") != ARROW_JSON_ENGINE
+            or not kwargs.get("lines")
+            or not _is_arrow_compatible(kwargs, ARROW_JSON_SUPPORTED_KWARGS)
+        ):
+            return pd.read_json(path, **kwargs)
+        filesystem, file_path = filesystem_and_path
+        read_options = pa_json.ReadOptions(use_threads=True, block_size=ARROW_JSON_BLOCK_SIZE)
+        with filesystem.open_input_stream(file_path) as stream:
+            table = pa_json.read_json(stream, read_options=read_options)
+        if chunksize := kwargs.get("chunksize"):
+            return _iter_arrow_tables(iter([table]), chunksize)
+        return table
+
+    def __read_orc(self, path: str, kwargs: dict[str, Any]) -> pa.Table | pd.DataFrame:
+        filesystem_and_path = _resolve_filesystem(path)
+        if filesystem_and_path is None or not _is_arrow_compatible(kwargs, ARROW_ORC_SUPPORTED_KWARGS):
+            return pd.read_orc(path, **kwargs)
+        filesystem, file_path = filesystem_and_path
+        with filesystem.open_input_file(file_path) as orc_source:
+            return pa_orc.ORCFile(orc_source).read(columns=kwargs.get("columns"))
+
+
+def _to_arrow_csv_options(kwargs: dict[str, Any]) -> tuple[pa_csv.ParseOptions, pa_csv.ConvertOptions] | None:
+    """
+    Translate the pandas `read_csv` kwargs to Arrow CSV options.
+    Returns None if any of the kwargs has no Arrow equivalent, so the caller can fall back to pandas.
+    """
+    if not ARROW_CSV_SUPPORTED_KWARGS.issuperset(kwargs) or kwargs.get("dtype_backend") != ARROW_DTYPE_BACKEND:
+        return None
+    delimiter = _get_csv_delimiter(kwargs)
+    dtype = {} if kwargs.get("dtype") is None else kwargs["dtype"]
+    na_values = kwargs.get("na_values") or []
+    if isinstance(na_values, str):
+        na_values = [na_values]
+    usecols = kwargs.get("usecols")
+    if delimiter is None or len(delimiter) != 1 or not isinstance(dtype, dict) or isinstance(na_values, dict):
+        return None
+    if usecols is not None and not all(isinstance(column, str) for column in usecols):
+        return None
+    column_types = {column: _to_arrow_type(column_dtype) for column, column_dtype in dtype.items()}
+    if None in column_types.values():
+        return None
+    convert_options = pa_csv.ConvertOptions(
+        column_types=column_types,
+        null_values=[*pa_csv.ConvertOptions().null_values, *na_values],
+        strings_can_be_null=True,
+        include_columns=list(usecols) if usecols is not None else None,
+    )
+    return pa_csv.ParseOptions(delimiter=delimiter), convert_options
+
+
+def _get_csv_cache_key(
+    path: str, parse_options: pa_csv.ParseOptions, convert_options: pa_csv.ConvertOptions
+) -> CsvCacheKey:
+    return (
+        path,
+        parse_options.delimiter,
+        tuple(convert_options.include_columns),
+        tuple(convert_options.null_values),
+    )
+
+
+def _get_inferred_csv_column_types(schema: pa.Schema) -> dict[str, pa.DataType]:
+    """
+    Column types to read the CSV with, based on the schema Arrow infers from the first block.
+    Columns inferred as dates or times are kept as strings, as pandas does without `parse_dates`,
+    and columns holding only nulls so far are left to inference.
+    """
+    return {
+        field.name: pa.string() if pa.types.is_temporal(field.type) else field.type
+        for field in schema
+        if not pa.types.is_null(field.type)
+    }
+
+
+def _get_csv_delimiter(kwargs: dict[str, Any]) -> str | None:
+    """
+    Get the delimiter set in the pandas `read_csv` kwargs, "," by default.
+    Returns None if `sep` or `delimiter` is explicitly None, as pandas then sniffs the delimiter from the file.
+    """
+    if any(key in kwargs and kwargs[key] is None for key in ("sep", "delimiter")):
+        return None
+    return kwargs.get("sep", kwargs.get("delimiter")) or ","
+
+
+def _is_csv_splittable(kwargs: dict[str, Any]) -> bool:
+    delimiter = _get_csv_delimiter(kwargs)
+    dtype = kwargs.get("dtype")
+    return (
+        PANDAS_CSV_SPLITTABLE_KWARGS.issuperset(kwargs)
+        and delimiter is not None
+        and len(delimiter) == 1
+        and (dtype is None or isinstance(dtype, dict))
+    )
+
+
+def _read_csv_column_names(header: pa.Buffer, kwargs: dict[str, Any]) -> list[str]:
+    delimiter_kwargs = {key: kwargs[key] for key in ("sep", "delimiter") if key in kwargs}
+    return pd.read_csv(pa.BufferReader(header), nrows=0, **delimiter_kwargs).columns.tolist()
+
+
+def _read_csv_chunk(chunk: pa.Buffer, column_names: list[str], kwargs: dict[str, Any]) -> pd.DataFrame:
+    """
+    Parse a range of the memory-mapped CSV without copying it out of the mapping first.
+    The range holds no header row, so the column names of the file are passed explicitly.
+    """
+    return pd.read_csv(pa.BufferReader(chunk), engine="c", header=None, names=column_names, **kwargs)
+
+
+def _get_mixed_type_columns(frames: list[pd.DataFrame]) -> list[str]:
+    return [
+        column
+        for column in frames[0].columns
+        if len({frame[column].dtype for frame in frames}) > 1
+        and not all(_is_non_bool_numeric_dtype(frame[column].dtype) for frame in frames)
+    ]
+
+
+def _is_non_bool_numeric_dtype(dtype: np.dtype | pd.api.extensions.ExtensionDtype) -> bool:
+    return pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+
+
+def _to_arrow_type(dtype: npt.DTypeLike) -> pa.DataType | None:
+    if dtype is str or (isinstance(dtype, str) and dtype in ARROW_STRING_DTYPES):
+        return pa.string()
+    try:
+        return pa.from_numpy_dtype(np.dtype(dtype))
+    except (TypeError, pa.ArrowNotImplementedError):
+        return None
+
+
+def _rebatch(batches: Iterable[pa.RecordBatch], chunksize: int) -> Iterator[pa.Table]:
+    pending: list[pa.RecordBatch] = []
+    pending_rows = 0
+    for batch in batches:
+        pending.append(batch)
+        pending_rows += batch.num_rows
+        while pending_rows >= chunksize:
+            table = pa.Table.from_batches(pending)
+            yield table.slice(0, chunksize)
+            remainder = table.slice(chunksize)
+            pending = remainder.to_batches()
+            pending_rows = remainder.num_rows
+    if pending_rows:
+        yield pa.Table.from_batches(pending)
+
+
+def _arrow_to_pandas(data: pa.Table | pa.RecordBatch) -> pd.DataFrame:
+    return data.to_pandas(split_blocks=True, self_destruct=True, types_mapper=pd.ArrowDtype)
+
+
+def _to_put_frame(data: pa.Table | pd.DataFrame) -> pd.DataFrame:
+    return _to_numpy_temporal_columns(_arrow_to_pandas(data) if isinstance(data, pa.Table) else data)
+
+
+def _to_numpy_temporal_columns(data_frame: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert the Arrow-backed date, time and timestamp columns to the NumPy-backed ones pandas returns without
+    `dtype_backend`. The schema parsers cast timestamps with `astype(int)`, which Arrow-backed columns do not support.
+    """
+    temporal_columns = [
+        column
+        for column, dtype in data_frame.dtypes.items()
+        if isinstance(dtype, pd.ArrowDtype) and pa.types.is_temporal(dtype.pyarrow_dtype)
+    ]
+    if not temporal_columns:
+        return data_frame
+    data_frame = data_frame.copy(deep=False)
+    for column in temporal_columns:
+        converted_column = pa.array(data_frame[column].array).to_pandas()
+        converted_column.index = data_frame.index
+        data_frame[column] = converted_column
+    return data_frame
+
+
+def _iter_arrow_tables(tables: Iterator[pa.Table], chunksize: int | None) -> Iterator[pd.DataFrame]:
+    if chunksize:
+        tables = _rebatch((batch for table in tables for batch in table.to_batches()), chunksize)
+    for table in tables:
+        yield _arrow_to_pandas(table)
+
+
+def _iter_frame_chunks(data_frame: pd.DataFrame, chunksize: int) -> Iterator[pd.DataFrame]:
+    for start in range(0, len(data_frame), chunksize):
+        yield data_frame.iloc[start : start + chunksize]
+
+
+def _read_row_groups(parquet_file: pa_parquet.ParquetFile, columns: list[str] | None) -> Iterator[pa.Table]:
+    with parquet_file:
+        for i in range(parquet_file.metadata.num_row_groups):
+            yield parquet_file.read_row_group(i, columns=columns, use_threads=True, use_pandas_metadata=True)
+
+
+def _read_remote_row_groups(path: str, filesystem: pa_fs.FileSystem, columns: list[str] | None) -> Iterator[pa.Table]:
+    """
+    Read the file by ranged requests, one row group at a time, without downloading the whole object.
+    The footer is fetched first, then the column chunks of each row group are coalesced into
+    as few requests as the network metrics in `REMOTE_PARQUET_FORMAT` make worthwhile.
+    """
+    fragment = REMOTE_PARQUET_FORMAT.make_fragment(path, filesystem=filesystem)
+    for row_group in fragment.split_by_row_group():
+        yield row_group.to_table(columns=columns, use_threads=True)
+
+
+def _resolve_filesystem(path: str) -> tuple[pa_fs.FileSystem, str] | None:
+    if _is_local_path(path):
+        return pa_fs.LocalFileSystem(use_mmap=True), path.removeprefix("file://")
+    if path.startswith(HTTP_SCHEMES):
+        return pa_fs.PyFileSystem(pa_fs.FSSpecHandler(fsspec.filesystem("http"))), path
+    try:
+        return pa_fs.FileSystem.from_uri(path)
+    except (OSError, pa.ArrowInvalid, pa.ArrowNotImplementedError):
+        logger.debug("No Arrow filesystem is available for path: %s", path)
+        return None
+
+
+def _is_arrow_compatible(kwargs: dict[str, Any], supported_kwargs: frozenset[str]) -> bool:
+    return supported_kwargs.issuperset(kwargs) and kwargs.get("dtype_backend") == ARROW_DTYPE_BACKEND
+
 
-    def __read_data(
-        self, path: str, data_format: DataFormat, pandas_read_kwargs: dict[str, Any] | None
-    ) -> pd.DataFrame | TextFileReader | JsonReader:
-        kwargs = pandas_read_kwargs or {}
-        match data_format:
-            case DataFormat.CSV:
-                return pd.read_csv(path, **kwargs)
-            case DataFormat.FWF:
-                return pd.read_fwf(path, **kwargs)
-            case DataFormat.XML:
-                return pd.read_xml(path, **kwargs)
-            case DataFormat.JSON:
-                return pd.read_json(path, **kwargs)
-            case DataFormat.PARQUET:
-                return pd.read_parquet(path, **kwargs)
-            case DataFormat.ORC:
-                return pd.read_orc(path, **kwargs)
-            case _:
-                msg = "Unsupported data format: %s"
-                raise ValueError(msg, data_format)
+def _is_local_path(path: str) -> bool:
+    return "://" not in path or path.startswith("file://")
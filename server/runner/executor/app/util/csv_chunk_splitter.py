@@ -0,0 +1,70 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import mmap
+
+import numpy as np
+
+NEWLINE = ord("\n")
+QUOTE = ord('"')
+SEARCH_WINDOW_SIZE = 1 << 16
+
+
+class CsvChunkSplitter:
+    """
+    Splits a CSV buffer into byte ranges that start and end on record boundaries, so each range
+    can be parsed on its own. A newline only ends a record if an even number of quote characters
+    precedes it, which keeps quoted fields containing line breaks in one piece.
+    """
+
+    @staticmethod
+    def find_header_end(data: bytes | mmap.mmap | memoryview) -> int | None:
+        return CsvChunkSplitter.__find_record_end(np.frombuffer(data, dtype=np.uint8), 0, 0)
+
+    @staticmethod
+    def split(data: bytes | mmap.mmap | memoryview, start: int, chunk_count: int) -> list[tuple[int, int]]:
+        buffer = np.frombuffer(data, dtype=np.uint8)
+        end = len(buffer)
+        target_size = max((end - start) // chunk_count, 1)
+        ranges: list[tuple[int, int]] = []
+        chunk_start = start
+        for _ in range(chunk_count - 1):
+            target = chunk_start + target_size
+            if target >= end:
+                break
+            quote_count = int(np.count_nonzero(buffer[chunk_start:target] == QUOTE))
+            chunk_end = CsvChunkSplitter.__find_record_end(buffer, target, quote_count)
+            if chunk_end is None:
+                break
+            ranges.append((chunk_start, chunk_end))
+            chunk_start = chunk_end
+        if chunk_start < end:
+            ranges.append((chunk_start, end))
+        return ranges
+
+    @staticmethod
+    def __find_record_end(buffer: np.ndarray, position: int, quote_count: int) -> int | None:
+        window_size = SEARCH_WINDOW_SIZE
+        while position < len(buffer):
+            window = buffer[position : position + window_size]
+            newlines = np.flatnonzero(window == NEWLINE)
+            quotes = np.flatnonzero(window == QUOTE)
+            if newlines.size:
+                unquoted = np.flatnonzero((quote_count + np.searchsorted(quotes, newlines)) % 2 == 0)
+                if unquoted.size:
+                    return position + int(newlines[unquoted[0]]) + 1
+            quote_count += quotes.size
+            position += window.size
+            window_size *= 2
+        return None
@@ -0,0 +1,274 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import os
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+from pydantic.alias_generators import to_snake
+from superlinked.framework.common.parser.dataframe_parser import DataFrameParser
+from superlinked.framework.common.parser.parsed_schema import ParsedSchema
+from superlinked.framework.common.schema.id_schema_object import IdField
+from superlinked.framework.common.schema.schema import schema
+from superlinked.framework.common.schema.schema_object import String, Timestamp
+from superlinked.framework.dsl.source.data_loader_source import DataFormat, DataLoaderConfig, DataLoaderSource
+
+from executor.app.service import data_loader as data_loader_module
+from executor.app.service.data_loader import DataLoader, ReadData
+
+
+@schema
+class Paper:
+    id: IdField
+    title: String
+    published_at: Timestamp
+
+
+paper = Paper()
+
+
+def load_parsed_values(data_loader: DataLoader, source: DataLoaderSource) -> list[dict[str, Any]]:
+    data_loader.register_data_loader_sources([source])
+    name = to_snake(source.name)
+    with patch.object(source._source, "_dispatch") as dispatch:  # noqa: SLF001 private-member-access
+
+        async def load() -> None:
+            data_loader.load(name)
+            await data_loader._data_loader_tasks[name]  # noqa: SLF001 private-member-access
+
+        asyncio.run(load())
+    return [to_values(parsed_schema) for call in dispatch.call_args_list for parsed_schema in call.args[0]]
+
+
+def read_data(
+    data_loader: DataLoader, path: Path, data_format: DataFormat, pandas_read_kwargs: dict[str, Any] | None = None
+) -> ReadData:
+    return data_loader._DataLoader__read_data(str(path), data_format, pandas_read_kwargs)  # type: ignore[attr-defined] # noqa: SLF001 private-member-access
+
+
+def csv_column_types_cache(data_loader: DataLoader) -> dict:
+    return data_loader._DataLoader__csv_column_types  # type: ignore[attr-defined] # noqa: SLF001 private-member-access
+
+
+def to_values(parsed_schema: ParsedSchema) -> dict[str, Any]:
+    return {"id": parsed_schema.id_} | {field.schema_field.name: field.value for field in parsed_schema.fields}
+
+
+@pytest.fixture
+def data_loader() -> DataLoader:
+    return DataLoader(MagicMock(DATA_LOADER_THREAD_COUNT=2))
+
+
+@pytest.fixture
+def papers() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "id": ["a", "b", "c"],
+            "title": ["first", "second", "third"],
+            "published_at": pd.to_datetime([1700000000000, 1700000001000, 1700000002000], unit="ms").astype(
+                "datetime64[ms]"
+            ),
+        }
+    )
+
+
+@pytest.mark.parametrize("pandas_read_kwargs", [None, {"chunksize": 2}])
+def test_parquet_timestamp_column_is_parsed_like_numpy_backed_frame(
+    tmp_path: Path, data_loader: DataLoader, papers: pd.DataFrame, pandas_read_kwargs: dict[str, Any] | None
+) -> None:
+    path = tmp_path / "papers.parquet"
+    papers.to_parquet(path)
+    source = DataLoaderSource(paper, DataLoaderConfig(str(path), DataFormat.PARQUET, None, pandas_read_kwargs))
+
+    values = load_parsed_values(data_loader, source)
+
+    expected = [to_values(parsed) for parsed in DataFrameParser(paper).unmarshal(pd.read_parquet(path))]
+    assert values == expected
+    assert values[0]["published_at"] == 1700000000000
+
+
+@pytest.mark.parametrize("pandas_read_kwargs", [{"lines": True}, {"lines": True, "engine": "pyarrow"}])
+def test_jsonl_timestamp_column_is_parsed_like_numpy_backed_frame(
+    tmp_path: Path, data_loader: DataLoader, papers: pd.DataFrame, pandas_read_kwargs: dict[str, Any]
+) -> None:
+    path = tmp_path / "papers.jsonl"
+    papers.assign(published_at=papers["published_at"].astype("int64") // 1000).to_json(
+        path, orient="records", lines=True
+    )
+    source = DataLoaderSource(paper, DataLoaderConfig(str(path), DataFormat.JSON, None, pandas_read_kwargs))
+
+    values = load_parsed_values(data_loader, source)
+
+    expected = [
+        to_values(parsed) for parsed in DataFrameParser(paper).unmarshal(pd.read_json(path, **pandas_read_kwargs))
+    ]
+    assert values == expected
+
+
+@pytest.mark.parametrize("typed_read_first", [True, False])
+def test_csv_column_types_set_by_user_are_not_shared_between_reads(
+    tmp_path: Path, data_loader: DataLoader, *, typed_read_first: bool
+) -> None:
+    path = tmp_path / "scores.csv"
+    path.write_text("id,score\na,1\nb,2\n")
+    typed_kwargs = {"dtype": {"score": "float64"}}
+
+    reads = [typed_kwargs, None] if typed_read_first else [None, typed_kwargs]
+    frames = [read_data(data_loader, path, DataFormat.CSV, kwargs) for kwargs in reads]
+
+    typed_frame, inferred_frame = frames if typed_read_first else frames[::-1]
+    assert typed_frame["score"].dtype == pd.ArrowDtype(pa.float64())
+    assert inferred_frame["score"].dtype == pd.ArrowDtype(pa.int64())
+
+
+def test_csv_column_types_are_inferred_again_when_file_changes(tmp_path: Path, data_loader: DataLoader) -> None:
+    path = tmp_path / "codes.csv"
+    path.write_text("code\nabc\n")
+    first_frame = read_data(data_loader, path, DataFormat.CSV)
+    path.write_text("code\n12\n")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    second_frame = read_data(data_loader, path, DataFormat.CSV)
+
+    assert first_frame["code"].dtype == pd.ArrowDtype(pa.string())
+    assert second_frame["code"].dtype == pd.ArrowDtype(pa.int64())
+
+
+def test_csv_column_types_are_cached_per_file_version(tmp_path: Path, data_loader: DataLoader) -> None:
+    path = tmp_path / "codes.csv"
+    path.write_text("code\n12\n")
+    read_data(data_loader, path, DataFormat.CSV)
+
+    with patch.object(data_loader_module.pa_csv, "open_csv", side_effect=AssertionError) as open_csv:
+        frame = read_data(data_loader, path, DataFormat.CSV)
+
+    open_csv.assert_not_called()
+    assert frame["code"].dtype == pd.ArrowDtype(pa.int64())
+    assert len(csv_column_types_cache(data_loader)) == 1
+
+
+@pytest.mark.parametrize("pandas_read_kwargs", [None, {"chunksize": 2}])
+def test_csv_cache_entry_is_dropped_when_arrow_cannot_parse_the_file(
+    tmp_path: Path,
+    data_loader: DataLoader,
+    monkeypatch: pytest.MonkeyPatch,
+    pandas_read_kwargs: dict[str, Any] | None,
+) -> None:
+    monkeypatch.setattr(data_loader_module, "ARROW_CSV_BLOCK_SIZE", 16)
+    path = tmp_path / "values.csv"
+    path.write_text("value\n" + "1\n" * 20 + "x\n")
+
+    data = read_data(data_loader, path, DataFormat.CSV, pandas_read_kwargs)
+    frame = data if isinstance(data, pd.DataFrame) else pd.concat(data, ignore_index=True)
+
+    assert frame["value"].astype(str).tolist() == pd.read_csv(path, dtype=str)["value"].tolist()
+    assert csv_column_types_cache(data_loader) == {}
+
+
+@pytest.mark.parametrize("delimiter_key", ["sep", "delimiter"])
+def test_csv_delimiter_set_to_none_is_sniffed_by_pandas(
+    tmp_path: Path, data_loader: DataLoader, delimiter_key: str
+) -> None:
+    path = tmp_path / "semicolons.csv"
+    path.write_text("id;name\na;first\nb;second\n")
+
+    frame = read_data(data_loader, path, DataFormat.CSV, {delimiter_key: None})
+
+    pd.testing.assert_frame_equal(frame, pd.read_csv(path, **{delimiter_key: None}, dtype_backend="pyarrow"))
+
+
+def test_blocked_chunked_source_does_not_hold_up_other_sources(
+    tmp_path: Path, data_loader: DataLoader, papers: pd.DataFrame
+) -> None:
+    release_stream = threading.Event()
+
+    def read_stream(_path: str, _kwargs: dict[str, Any]) -> Iterator[pd.DataFrame]:
+        yield papers.iloc[:1]
+        release_stream.wait(timeout=10)
+        yield papers.iloc[1:]
+
+    data_loader._DataLoader__readers[DataFormat.XML] = read_stream  # type: ignore[attr-defined] # noqa: SLF001 private-member-access
+    path = tmp_path / "papers.parquet"
+    papers.to_parquet(path)
+    stream_source = DataLoaderSource(paper, DataLoaderConfig("stream.xml", DataFormat.XML, "stream"))
+    file_source = DataLoaderSource(paper, DataLoaderConfig(str(path), DataFormat.PARQUET, "file"))
+    data_loader.register_data_loader_sources([stream_source, file_source])
+
+    async def load() -> bool:
+        data_loader.load("stream")
+        data_loader.load("file")
+        await asyncio.wait_for(data_loader._data_loader_tasks["file"], timeout=5)  # noqa: SLF001 private-member-access
+        is_stream_running = not data_loader._data_loader_tasks["stream"].done()  # noqa: SLF001 private-member-access
+        release_stream.set()
+        await data_loader._data_loader_tasks["stream"]  # noqa: SLF001 private-member-access
+        return is_stream_running
+
+    with (
+        patch.object(stream_source._source, "_dispatch") as stream_dispatch,  # noqa: SLF001 private-member-access
+        patch.object(file_source._source, "_dispatch") as file_dispatch,  # noqa: SLF001 private-member-access
+    ):
+        is_stream_running = asyncio.run(load())
+
+    assert is_stream_running
+    assert sum(len(call.args[0]) for call in file_dispatch.call_args_list) == len(papers)
+    assert sum(len(call.args[0]) for call in stream_dispatch.call_args_list) == len(papers)
+
+
+def test_chunked_source_error_fails_the_load(
+    data_loader: DataLoader, papers: pd.DataFrame
+) -> None:
+    def read_stream(_path: str, _kwargs: dict[str, Any]) -> Iterator[pd.DataFrame]:
+        yield papers.iloc[:1]
+        msg = "broken stream"
+        raise ValueError(msg)
+
+    data_loader._DataLoader__readers[DataFormat.XML] = read_stream  # type: ignore[attr-defined] # noqa: SLF001 private-member-access
+    source = DataLoaderSource(paper, DataLoaderConfig("stream.xml", DataFormat.XML, "stream"))
+
+    with pytest.raises(ValueError, match="broken stream"):
+        load_parsed_values(data_loader, source)
+
+
+@pytest.mark.parametrize(
+    "pandas_read_kwargs",
+    [
+        {"dtype_backend": None},
+        {"usecols": ["name", "id.1"], "dtype": {"id.1": "float64"}, "thousands": ","},
+        {"sep": ";", "thousands": ","},
+    ],
+)
+def test_csv_read_in_parallel_matches_single_pass_read(
+    tmp_path: Path, data_loader: DataLoader, monkeypatch: pytest.MonkeyPatch, pandas_read_kwargs: dict[str, Any]
+) -> None:
+    monkeypatch.setattr(data_loader_module, "CSV_SPLIT_MIN_CHUNK_SIZE", 64)
+    separator = pandas_read_kwargs.get("sep", ",")
+    rows = [separator.join([str(row), f'"name {row}\nline"', f'"{row},000"']) for row in range(50)]
+    path = tmp_path / "people.csv"
+    path.write_text("\n".join([separator.join(["id", "name", "id"]), *rows]) + "\n")
+
+    with patch.object(data_loader_module.pd, "read_csv", wraps=pd.read_csv) as read_csv:
+        frame = read_data(data_loader, path, DataFormat.CSV, pandas_read_kwargs)
+
+    assert read_csv.call_count == 1 + data_loader._app_config.DATA_LOADER_THREAD_COUNT  # noqa: SLF001 private-member-access
+    expected_kwargs = {"dtype_backend": "pyarrow"} | pandas_read_kwargs
+    expected = pd.read_csv(path, **{key: value for key, value in expected_kwargs.items() if value is not None})
+    pd.testing.assert_frame_equal(frame, expected)
@@ -0,0 +1,102 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import mmap
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from executor.app.util.csv_chunk_splitter import CsvChunkSplitter
+
+
+def read_chunks(data: bytes, chunk_count: int) -> pd.DataFrame:
+    header_end = CsvChunkSplitter.find_header_end(data)
+    assert header_end is not None
+    ranges = CsvChunkSplitter.split(data, header_end, chunk_count)
+    frames = [pd.read_csv(io.BytesIO(data[:header_end] + data[start:end])) for start, end in ranges]
+    return pd.concat(frames, ignore_index=True)
+
+
+def test_find_header_end() -> None:
+    assert CsvChunkSplitter.find_header_end(b"id,name\n1,a\n") == len(b"id,name\n")
+
+
+def test_find_header_end_with_quoted_newline_in_header() -> None:
+    assert CsvChunkSplitter.find_header_end(b'id,"first\nname"\n1,a\n') == len(b'id,"first\nname"\n')
+
+
+def test_find_header_end_without_trailing_newline() -> None:
+    assert CsvChunkSplitter.find_header_end(b"id,name") is None
+
+
+def test_split_covers_the_whole_buffer_on_record_boundaries() -> None:
+    data = b"id,name\n" + b"".join(f"{i},name{i}\n".encode() for i in range(1000))
+    header_end = len(b"id,name\n")
+
+    ranges = CsvChunkSplitter.split(data, header_end, 4)
+
+    assert len(ranges) == 4
+    assert ranges[0][0] == header_end
+    assert ranges[-1][1] == len(data)
+    assert all(previous[1] == current[0] for previous, current in zip(ranges, ranges[1:]))
+    assert all(data[end - 1 : end] == b"\n" for _, end in ranges)
+
+
+@pytest.mark.parametrize("chunk_count", [2, 3, 7])
+def test_split_keeps_quoted_newlines_in_one_record(chunk_count: int) -> None:
+    rows = [f'{i},"line one\nline two {i}\n"\n' for i in range(200)]
+    data = ("id,text\n" + "".join(rows)).encode()
+
+    result = read_chunks(data, chunk_count)
+
+    pd.testing.assert_frame_equal(result, pd.read_csv(io.BytesIO(data)))
+
+
+@pytest.mark.parametrize("chunk_count", [2, 3, 7])
+def test_split_handles_escaped_quotes(chunk_count: int) -> None:
+    rows = [f'{i},"say ""hi""\nthen ""bye"""\n' for i in range(200)]
+    data = ("id,text\n" + "".join(rows)).encode()
+
+    result = read_chunks(data, chunk_count)
+
+    pd.testing.assert_frame_equal(result, pd.read_csv(io.BytesIO(data)))
+
+
+def test_split_with_last_record_without_trailing_newline() -> None:
+    data = b"id,name\n" + b"\n".join(f"{i},name{i}".encode() for i in range(100))
+
+    result = read_chunks(data, 3)
+
+    pd.testing.assert_frame_equal(result, pd.read_csv(io.BytesIO(data)))
+
+
+def test_split_returns_single_range_when_no_boundary_follows_target() -> None:
+    data = b'id,text\n1,"' + b"x\n" * 100 + b'"\n'
+    header_end = len(b"id,text\n")
+
+    assert CsvChunkSplitter.split(data, header_end, 4) == [(header_end, len(data))]
+
+
+def test_split_reads_memory_mapped_file(tmp_path: Path) -> None:
+    data = b"id,name\n" + b"".join(f"{i},name{i}\n".encode() for i in range(100))
+    path = tmp_path / "data.csv"
+    path.write_bytes(data)
+
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+        header_end = CsvChunkSplitter.find_header_end(mapped_file)
+        ranges = CsvChunkSplitter.split(mapped_file, header_end or 0, 2)
+
+    assert ranges == CsvChunkSplitter.split(data, header_end or 0, 2)